@@ -6,10 +6,172 @@ This script extracts key frames or frames at regular intervals from video files.
 
 import os
 import sys
+import queue
 import argparse
+import threading
 import cv2
 import numpy as np
 from pathlib import Path
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional accelerators: PyAV (FFmpeg) for decoding and libjpeg-turbo for
+# encoding. Both fall back to OpenCV when they are not installed.
+try:
+    import av
+except ImportError:
+    av = None
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    turbo_jpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    # RuntimeError is raised when the libturbojpeg shared library is missing
+    turbo_jpeg = None
+
+# Number of decoded frames the decoder thread may read ahead of the analysis
+# stage; full resolution frames are large, so only a few are buffered
+PIPELINE_DEPTH = 4
+
+# Smallest comparison frame (in pixels) worth uploading to an OpenCL device;
+# below this the transfer costs more than the CPU SIMD kernels
+OPENCL_MIN_PIXELS = 1280 * 720
+
+
+def write_jpeg(frame_path, frame, quality=95):
+    """
+    Write a BGR frame to disk as a JPEG file.
+    Uses libjpeg-turbo (PyTurboJPEG) when available, otherwise cv2.imwrite.
+    """
+    if turbo_jpeg is not None:
+        with open(frame_path, 'wb') as f:
+            f.write(turbo_jpeg.encode(frame, quality=quality, pixel_format=TJPF_BGR))
+    else:
+        cv2.imwrite(str(frame_path), frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+
+
+def gpu_decoding_available():
+    """Check whether OpenCV was built with CUDA video decoding and a CUDA device is present."""
+    if not hasattr(cv2, 'cudacodec'):
+        return False
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except cv2.error:
+        return False
+
+
+def open_video_gpu(video_path, max_width=1920):
+    """
+    Open a video file for decoding on the GPU with cv2.cudacodec (NVDEC).
+    Frames are resized and converted to BGR on the GPU; only the result is
+    downloaded to host memory.
+    
+    Returns:
+        (fps, total_frames, frames) like open_video, or None if NVDEC cannot
+        decode the video
+    """
+    # NVDEC does not report container metadata reliably across OpenCV
+    # versions, so read it with a (non-decoding) VideoCapture probe
+    probe = cv2.VideoCapture(str(video_path))
+    if not probe.isOpened():
+        return None
+    fps = probe.get(cv2.CAP_PROP_FPS)
+    total_frames = int(probe.get(cv2.CAP_PROP_FRAME_COUNT))
+    probe.release()
+    
+    try:
+        reader = cv2.cudacodec.createVideoReader(str(video_path))
+    except cv2.error:
+        return None
+    
+    def frames():
+        while True:
+            ret, gpu_frame = reader.nextFrame()
+            if not ret:
+                break
+            width, height = gpu_frame.size()
+            if width > max_width:
+                new_height = int(height * max_width / width)
+                gpu_frame = cv2.cuda.resize(gpu_frame, (max_width, new_height), interpolation=cv2.INTER_AREA)
+            # NVDEC returns BGRA frames
+            gpu_frame = cv2.cuda.cvtColor(gpu_frame, cv2.COLOR_BGRA2BGR)
+            yield gpu_frame.download()
+    
+    return fps, total_frames, frames()
+
+
+def open_video(video_path, max_width=1920):
+    """
+    Open a video file for sequential decoding.
+    
+    On an OpenCV build with CUDA video decoding (cv2.cudacodec) and a CUDA
+    device, frames are decoded by NVDEC and downscaled to at most max_width on
+    the GPU. With PyAV installed, frames are decoded by FFmpeg with frame
+    threading and downscaled during the pixel format conversion, so no full
+    resolution BGR copy is made. Otherwise cv2.VideoCapture is used and frames
+    are returned at their original size.
+    
+    Returns:
+        (fps, total_frames, frames) where frames is a generator of BGR images,
+        or None if the video could not be opened
+    """
+    if gpu_decoding_available():
+        video = open_video_gpu(video_path, max_width)
+        if video is not None:
+            return video
+    
+    if av is not None:
+        try:
+            container = av.open(str(video_path))
+            stream = container.streams.video[0]
+        except (av.error.FFmpegError, IndexError):
+            return None
+        stream.thread_type = 'AUTO'
+        fps = float(stream.average_rate) if stream.average_rate else 0
+        total_frames = stream.frames
+        if not total_frames and stream.duration and stream.time_base:
+            total_frames = int(stream.duration * stream.time_base * fps)
+        
+        def frames():
+            # Packets are decoded one by one so a corrupt packet is skipped
+            # instead of aborting the video, as cv2.VideoCapture does
+            try:
+                for packet in container.demux(stream):
+                    try:
+                        decoded = packet.decode()
+                    except av.error.InvalidDataError:
+                        continue
+                    for frame in decoded:
+                        if frame.width > max_width:
+                            new_height = int(frame.height * max_width / frame.width)
+                            frame = frame.reformat(width=max_width, height=new_height,
+                                                   format='bgr24', interpolation='AREA')
+                        yield frame.to_ndarray(format='bgr24')
+            except av.error.InvalidDataError:
+                # Unreadable container data: end the stream like cap.read() returning False
+                pass
+            finally:
+                container.close()
+        
+        return fps, total_frames, frames()
+    
+    cap = cv2.VideoCapture(str(video_path))
+    if not cap.isOpened():
+        return None
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    
+    def frames():
+        try:
+            while True:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                yield frame
+        finally:
+            cap.release()
+    
+    return fps, total_frames, frames()
 
 
 def extract_frames(video_path, output_dir, interval=5, max_frames=None):
@@ -81,7 +243,7 @@ def extract_frames(video_path, output_dir, interval=5, max_frames=None):
                 new_height = int(height * scale)
                 frame = cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_AREA)
             
-            cv2.imwrite(str(frame_path), frame, [cv2.IMWRITE_JPEG_QUALITY, 95])
+            write_jpeg(frame_path, frame)
             extracted_frames.append(frame_path)
             saved_count += 1
             print(f"  Extracted frame {saved_count}: {frame_filename}")
@@ -93,29 +255,90 @@ def extract_frames(video_path, output_dir, interval=5, max_frames=None):
     return extracted_frames
 
 
-def calculate_frame_difference(frame1, frame2):
+def calculate_histogram(gray):
+    """
+    Calculate the 256-bin histogram of a grayscale frame, centered and scaled
+    to unit length so the correlation of two histograms is their dot product.
+    """
+    hist = cv2.calcHist([gray], [0], None, [256], [0, 256]).ravel()
+    hist -= hist.mean()
+    norm = np.linalg.norm(hist)
+    return hist / norm if norm > 0 else hist
+
+
+def calculate_frame_difference(gray_prev, hist_prev, gray_cur, hist_cur=None):
     """
     Calculate the difference between two frames using multiple metrics.
     
+    Args:
+        gray_prev: Grayscale reference frame
+        hist_prev: Histogram of the reference frame from calculate_histogram
+        gray_cur: Grayscale frame to compare against the reference
+        hist_cur: Histogram of gray_cur, computed if not given (optional)
+    
     Returns:
         mse: Mean Squared Error
         ssim_like: Structural similarity approximation
     """
-    # Convert to grayscale for comparison
-    gray1 = cv2.cvtColor(frame1, cv2.COLOR_BGR2GRAY)
-    gray2 = cv2.cvtColor(frame2, cv2.COLOR_BGR2GRAY)
-    
-    # Calculate MSE
-    mse = np.mean((gray1 - gray2) ** 2)
+    # Calculate MSE with OpenCV's two-input norm, which accumulates the squared
+    # differences in one SIMD pass without a temporary (or wrapping uint8) diff.
+    # Large frames (--resize-width 1280 or more) go through the OpenCL backend
+    # (T-API), which OpenCV enables by default when a device is available.
+    if cv2.ocl.useOpenCL() and gray_cur.size >= OPENCL_MIN_PIXELS:
+        sq_diff = cv2.norm(cv2.UMat(gray_prev), cv2.UMat(gray_cur), cv2.NORM_L2SQR)
+    else:
+        sq_diff = cv2.norm(gray_prev, gray_cur, cv2.NORM_L2SQR)
+    mse = sq_diff / gray_cur.size
     
     # Calculate histogram difference
-    hist1 = cv2.calcHist([gray1], [0], None, [256], [0, 256])
-    hist2 = cv2.calcHist([gray2], [0], None, [256], [0, 256])
-    hist_diff = cv2.compareHist(hist1, hist2, cv2.HISTCMP_CORREL)
+    if hist_cur is None:
+        hist_cur = calculate_histogram(gray_cur)
+    hist_diff = float(np.dot(hist_prev, hist_cur))
     
     return mse, hist_diff
 
 
+def prepare_frame(frame, resize_width):
+    """
+    Downscale a frame for comparison and compute its grayscale metrics.
+    Runs on the worker threads of extract_different_frames.
+    
+    Returns:
+        (frame, gray, hist, avg_brightness, std_brightness)
+    """
+    # Resize for comparison (faster processing); frames are never modified,
+    # so a frame that is small enough is used as is without a copy
+    height, width = frame.shape[:2]
+    if width > resize_width:
+        scale = resize_width / width
+        comparison_width = resize_width
+        comparison_height = int(height * scale)
+        frame_resized = cv2.resize(frame, (comparison_width, comparison_height), interpolation=cv2.INTER_AREA)
+    else:
+        frame_resized = frame
+    
+    gray = cv2.cvtColor(frame_resized, cv2.COLOR_BGR2GRAY)
+    # Mean and standard deviation in a single pass
+    mean, std = cv2.meanStdDev(gray)
+    avg_brightness = float(mean[0, 0])
+    std_brightness = float(std[0, 0])
+    return frame, gray, calculate_histogram(gray), avg_brightness, std_brightness
+
+
+def save_frame(frame, frame_path, max_width=1920):
+    """
+    Save a frame as JPEG, resizing it first if it is wider than max_width.
+    Runs on the writer thread, so only kept frames pay for the resize.
+    """
+    height, width = frame.shape[:2]
+    if width > max_width:
+        scale = max_width / width
+        new_width = max_width
+        new_height = int(height * scale)
+        frame = cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_AREA)
+    write_jpeg(frame_path, frame)
+
+
 def extract_different_frames(video_path, output_dir, threshold=30.0, min_hist_diff=0.95, resize_width=640):
     """
     Extract only frames that are different from the previous frame.
@@ -142,13 +365,12 @@ def extract_different_frames(video_path, output_dir, threshold=30.0, min_hist_di
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Open video
-    cap = cv2.VideoCapture(str(video_path))
-    if not cap.isOpened():
+    video = open_video(video_path)
+    if video is None:
         print(f"Error: Could not open video file: {video_path}")
         return []
     
-    fps = cap.get(cv2.CAP_PROP_FPS)
-    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    fps, total_frames, frames = video
     duration = total_frames / fps if fps > 0 else 0
     
     print(f"Video: {video_path.name}")
@@ -161,7 +383,9 @@ def extract_different_frames(video_path, output_dir, threshold=30.0, min_hist_di
     extracted_frames = []
     frame_count = 0
     saved_count = 0
-    last_saved_frame = None
+    # Only the grayscale copy and histogram of the last saved frame are kept
+    last_saved_gray = None
+    last_saved_hist = None
     
     # Create a subdirectory for this video
     video_output_dir = output_dir / video_path.stem
@@ -170,102 +394,188 @@ def extract_different_frames(video_path, output_dir, threshold=30.0, min_hist_di
     # Progress tracking
     last_progress = 0
     
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
-        
-        frame_count += 1
-        timestamp = frame_count / fps
-        
-        # Resize for comparison (faster processing)
-        height, width = frame.shape[:2]
-        if width > resize_width:
-            scale = resize_width / width
-            comparison_width = resize_width
-            comparison_height = int(height * scale)
-            frame_resized = cv2.resize(frame, (comparison_width, comparison_height), interpolation=cv2.INTER_AREA)
-        else:
-            frame_resized = frame.copy()
-        
-        # Save first frame always (but check if it's not too dark)
-        if last_saved_frame is None:
-            # Check if first frame is too dark
-            gray_frame = cv2.cvtColor(frame_resized, cv2.COLOR_BGR2GRAY)
-            avg_brightness = np.mean(gray_frame)
-            std_brightness = np.std(gray_frame)
-            is_too_dark = avg_brightness < 40 and std_brightness < 15
-            
-            if not is_too_dark:
-                # Resize original frame for saving if needed
-                if width > 1920:
-                    scale = 1920 / width
-                    new_width = 1920
-                    new_height = int(height * scale)
-                    frame_to_save = cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_AREA)
-                else:
-                    frame_to_save = frame.copy()
-                
-                frame_filename = f"frame_{saved_count:04d}_t{timestamp:.2f}s.jpg"
-                frame_path = video_output_dir / frame_filename
-                cv2.imwrite(str(frame_path), frame_to_save, [cv2.IMWRITE_JPEG_QUALITY, 95])
-                extracted_frames.append(frame_path)
-                last_saved_frame = frame_resized.copy()
-                saved_count += 1
-                print(f"  Saved frame {saved_count} (first frame): {frame_filename}")
-            else:
-                # Skip first frame if too dark, will try next frame
+    # Pipeline: a producer thread decodes frames into a bounded queue, worker
+    # threads downscale and analyse them, and this thread consumes the results
+    # in frame order to decide what to keep. JPEG writes run on a separate
+    # writer thread so disk I/O overlaps with decoding.
+    frame_queue = queue.Queue(maxsize=PIPELINE_DEPTH)
+    producer_errors = []
+    
+    # Set when the consumer stops early (an error or Ctrl-C), so the producer
+    # gives up instead of blocking forever on a full queue
+    stop_event = threading.Event()
+    
+    def put_frame(frame):
+        while not stop_event.is_set():
+            try:
+                frame_queue.put(frame, timeout=0.1)
+                return True
+            except queue.Full:
                 continue
-        else:
-            # Compare with last saved frame
-            mse, hist_corr = calculate_frame_difference(last_saved_frame, frame_resized)
+        return False
+    
+    def produce():
+        try:
+            for frame in frames:
+                if not put_frame(frame):
+                    break
+        except Exception as e:
+            producer_errors.append(e)
+        finally:
+            # Closing the generator releases the decoder (VideoCapture or PyAV container)
+            frames.close()
+            put_frame(None)
+    
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    
+    num_workers = max(1, (os.cpu_count() or 2) // 2)
+    pending_writes = []
+    
+    try:
+        with ThreadPoolExecutor(max_workers=num_workers) as workers, \
+             ThreadPoolExecutor(max_workers=1) as writer:
             
-            # Check if frames are significantly different
-            is_different = mse > threshold or hist_corr < min_hist_diff
+            def prepared_frames():
+                # Futures are queued in submission order, so results come back in
+                # frame order. Two frames per worker keep every worker busy; each
+                # result holds a full size frame, so no more are kept in flight.
+                in_flight = deque()
+                max_in_flight = 2 * num_workers
+                while True:
+                    frame = frame_queue.get()
+                    if frame is None:
+                        break
+                    in_flight.append(workers.submit(prepare_frame, frame, resize_width))
+                    if len(in_flight) >= max_in_flight:
+                        yield in_flight.popleft().result()
+                while in_flight:
+                    yield in_flight.popleft().result()
             
-            # Filter out black/dark frames (fade to black, black screens, etc.)
-            # Calculate average brightness of the frame
-            gray_frame = cv2.cvtColor(frame_resized, cv2.COLOR_BGR2GRAY)
-            avg_brightness = np.mean(gray_frame)
-            std_brightness = np.std(gray_frame)
-            
-            # Skip frames that are too dark (black screens, fade to black)
-            # Threshold: average brightness < 40 and low contrast (std < 15)
-            is_too_dark = avg_brightness < 40 and std_brightness < 15
-            
-            if is_different and not is_too_dark:
-                # Resize original frame for saving if needed
-                if width > 1920:
-                    scale = 1920 / width
-                    new_width = 1920
-                    new_height = int(height * scale)
-                    frame_to_save = cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_AREA)
-                else:
-                    frame_to_save = frame.copy()
+            for frame_to_save, gray_frame, frame_hist, avg_brightness, std_brightness in prepared_frames():
+                frame_count += 1
+                timestamp = frame_count / fps
                 
-                frame_filename = f"frame_{saved_count:04d}_t{timestamp:.2f}s.jpg"
-                frame_path = video_output_dir / frame_filename
-                cv2.imwrite(str(frame_path), frame_to_save, [cv2.IMWRITE_JPEG_QUALITY, 95])
-                extracted_frames.append(frame_path)
-                last_saved_frame = frame_resized.copy()
-                saved_count += 1
+                # Skip frames that are too dark (black screens, fade to black)
+                # Threshold: average brightness < 40 and low contrast (std < 15)
+                is_too_dark = avg_brightness < 40 and std_brightness < 15
                 
-                if saved_count % 10 == 0 or saved_count == 1:
-                    print(f"  Saved frame {saved_count}: {frame_filename} (MSE: {mse:.2f}, Hist: {hist_corr:.3f})")
+                # Save first frame always (but check if it's not too dark)
+                if last_saved_gray is None:
+                    if not is_too_dark:
+                        frame_filename = f"frame_{saved_count:04d}_t{timestamp:.2f}s.jpg"
+                        frame_path = video_output_dir / frame_filename
+                        pending_writes.append(writer.submit(save_frame, frame_to_save, frame_path))
+                        extracted_frames.append(frame_path)
+                        last_saved_gray = gray_frame
+                        last_saved_hist = frame_hist
+                        saved_count += 1
+                        print(f"  Saved frame {saved_count} (first frame): {frame_filename}")
+                    else:
+                        # Skip first frame if too dark, will try next frame
+                        continue
+                else:
+                    # Compare with last saved frame
+                    mse, hist_corr = calculate_frame_difference(last_saved_gray, last_saved_hist,
+                                                                gray_frame, frame_hist)
+                    
+                    # Check if frames are significantly different
+                    is_different = mse > threshold or hist_corr < min_hist_diff
+                    
+                    if is_different and not is_too_dark:
+                        frame_filename = f"frame_{saved_count:04d}_t{timestamp:.2f}s.jpg"
+                        frame_path = video_output_dir / frame_filename
+                        pending_writes.append(writer.submit(save_frame, frame_to_save, frame_path))
+                        extracted_frames.append(frame_path)
+                        last_saved_gray = gray_frame
+                        last_saved_hist = frame_hist
+                        saved_count += 1
+                        
+                        if saved_count % 10 == 0 or saved_count == 1:
+                            print(f"  Saved frame {saved_count}: {frame_filename} (MSE: {mse:.2f}, Hist: {hist_corr:.3f})")
+                
+                # Progress update every 10%
+                progress = int((frame_count / total_frames) * 100) if total_frames > 0 else 0
+                if progress >= last_progress + 10:
+                    print(f"  Progress: {progress}% ({frame_count}/{total_frames} frames processed, {saved_count} unique frames saved)")
+                    last_progress = progress
+            
+            # Surface any write errors
+            for write in pending_writes:
+                write.result()
         
-        # Progress update every 10%
-        progress = int((frame_count / total_frames) * 100)
-        if progress >= last_progress + 10:
-            print(f"  Progress: {progress}% ({frame_count}/{total_frames} frames processed, {saved_count} unique frames saved)")
-            last_progress = progress
+    finally:
+        stop_event.set()
+        # Drain the queue to unblock a producer waiting on it, so it can exit
+        while True:
+            try:
+                frame_queue.get_nowait()
+            except queue.Empty:
+                break
+        producer.join()
+    
+    if producer_errors:
+        raise producer_errors[0]
     
-    cap.release()
     print(f"  Total frames processed: {frame_count}")
     print(f"  Unique frames extracted: {saved_count}")
     print(f"  Compression ratio: {saved_count/frame_count*100:.2f}%\n")
     return extracted_frames
 
 
+def read_frames_at(video_path, cap, frame_indices, fps, gop_estimate=60):
+    """
+    Yield the BGR frame at each of the given frame indices (None if it cannot be read).
+    
+    With PyAV installed, each target is reached by seeking to the preceding
+    keyframe and decoding forward only until the target timestamp. Otherwise
+    the already opened cv2.VideoCapture is advanced with grab() when the
+    target is less than gop_estimate frames ahead, or positioned with
+    CAP_PROP_POS_FRAMES.
+    """
+    if av is not None and fps > 0:
+        try:
+            container = av.open(str(video_path))
+            stream = container.streams.video[0]
+        except (av.error.FFmpegError, IndexError):
+            container = None
+        
+        if container is not None:
+            start_pts = stream.start_time or 0
+            try:
+                for frame_idx in frame_indices:
+                    target_pts = start_pts + int(frame_idx / fps / stream.time_base)
+                    target = None
+                    try:
+                        container.seek(target_pts, stream=stream, backward=True, any_frame=False)
+                        for frame in container.decode(stream):
+                            target = frame
+                            if frame.pts is None or frame.pts >= target_pts:
+                                break
+                    except av.error.FFmpegError:
+                        pass
+                    yield target.to_ndarray(format='bgr24') if target is not None else None
+            finally:
+                container.close()
+            return
+    
+    # Short forward gaps are skipped with grab(), which demuxes and decodes
+    # without the color conversion of retrieve(); larger or backward jumps
+    # are cheaper as a real seek
+    current = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+    for frame_idx in frame_indices:
+        skip = frame_idx - current
+        if 0 <= skip < gop_estimate:
+            for _ in range(skip):
+                if not cap.grab():
+                    break
+        else:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+        ret, frame = cap.read()
+        current = frame_idx + 1
+        yield frame if ret else None
+
+
 def extract_key_frames(video_path, output_dir, num_frames=10):
     """
     Extract evenly distributed key frames from a video.
@@ -306,11 +616,8 @@ def extract_key_frames(video_path, output_dir, num_frames=10):
     video_output_dir = output_dir / video_path.stem
     video_output_dir.mkdir(exist_ok=True)
     
-    for i, frame_idx in enumerate(frame_indices):
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
-        ret, frame = cap.read()
-        
-        if ret:
+    for i, (frame_idx, frame) in enumerate(zip(frame_indices, read_frames_at(video_path, cap, frame_indices, fps))):
+        if frame is not None:
             timestamp = frame_idx / fps if fps > 0 else 0
             frame_filename = f"frame_{i:04d}_t{timestamp:.2f}s.jpg"
             frame_path = video_output_dir / frame_filename
@@ -323,7 +630,7 @@ def extract_key_frames(video_path, output_dir, num_frames=10):
                 new_height = int(height * scale)
                 frame = cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_AREA)
             
-            cv2.imwrite(str(frame_path), frame, [cv2.IMWRITE_JPEG_QUALITY, 95])
+            write_jpeg(frame_path, frame)
             extracted_frames.append(frame_path)
             print(f"  Extracted frame {i+1}/{num_frames}: {frame_filename}")
     
@@ -342,6 +649,7 @@ def main():
     parser.add_argument("-d", "--different", action="store_true", help="Extract only frames that are different (default: False)")
     parser.add_argument("-t", "--threshold", type=float, default=30.0, help="MSE threshold for different frames (default: 30.0, lower = more sensitive)")
     parser.add_argument("--hist-threshold", type=float, default=0.95, help="Histogram correlation threshold (default: 0.95, lower = more sensitive)")
+    parser.add_argument("--resize-width", type=int, default=640, help="Width frames are resized to for comparison with -d (default: 640, larger = more accurate but slower)")
     
     args = parser.parse_args()
     
@@ -375,7 +683,8 @@ def main():
     all_frames = []
     for video_file in video_files:
         if args.different:
-            frames = extract_different_frames(video_file, output_dir, args.threshold, args.hist_threshold)
+            frames = extract_different_frames(video_file, output_dir, args.threshold, args.hist_threshold,
+                                              args.resize_width)
         elif args.num_frames:
             frames = extract_key_frames(video_file, output_dir, args.num_frames)
         else:
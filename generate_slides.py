@@ -4,21 +4,195 @@ Generate reveal.js markdown presentation from extracted video frames.
 """
 
 import os
+import mmap
 import argparse
 import cv2
 import numpy as np
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 
-def are_frames_similar(img1_path, img2_path, similarity_threshold=0.88, mse_threshold=5.0):
+# Image file types picked up as slide frames (lower case, matched case-insensitively)
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
+
+# Markdown emitted for each frame slide
+SLIDE_SEPARATOR = "---\n\n"
+SLIDE_TEMPLATE = (
+    '<!-- .slide: data-background="{path}" data-background-size="contain" data-background-color="black" -->\n'
+    '\n'
+    '<!-- Add your slide content here -->\n'
+    '\n'
+)
+
+# Size of the grayscale thumbnail used for pixel-wise frame comparison
+THUMBNAIL_SIZE = (64, 64)
+
+# Everything the duplicate and black-frame filters need from one decoded image
+FrameFeatures = namedtuple('FrameFeatures', ['thumb', 'avg_brightness', 'std_brightness', 'hist', 'phash',
+                                             'aspect_ratio'])
+
+
+def gray_histogram(gray):
     """
-    Check if two images are very similar (potential duplicates).
+    Calculate the 256-bin histogram of a grayscale image, centered and scaled
+    to unit length. The Pearson correlation of two such histograms (what
+    cv2.HISTCMP_CORREL computes) is then simply their dot product.
+    """
+    hist = cv2.calcHist([gray], [0], None, [256], [0, 256]).ravel()
+    hist -= hist.mean()
+    norm = np.linalg.norm(hist)
+    return hist / norm if norm > 0 else hist
+
+
+def phash(gray):
+    """
+    Calculate a 64-bit perceptual hash (pHash) of a grayscale image.
+    The image is shrunk to 32x32 and each bit records whether one of the 8x8
+    lowest DCT frequencies is above their median, so re-encoded or slightly
+    shifted copies of a frame have a small Hamming distance. The DC term
+    (overall brightness) is left out, giving 63 bits.
+    """
+    small = cv2.resize(gray, (32, 32), interpolation=cv2.INTER_AREA)
+    low_freq = cv2.dct(np.float32(small))[:8, :8].ravel()[1:]
+    bits = np.packbits(low_freq > np.median(low_freq))
+    return int.from_bytes(bits.tobytes(), 'big')
+
+
+def hamming_distance(hash1, hash2):
+    """Number of differing bits between two integer hashes."""
+    return bin(hash1 ^ hash2).count('1')
+
+
+def brightness_stats(gray):
+    """
+    Calculate the mean and standard deviation of a grayscale image.
+    
+    A 1-in-16 subsample (every 16th row and column) is measured first. If it is
+    clearly bright or clearly black, its estimate is returned because the
+    black-frame decision cannot change; only borderline frames get a full pass.
+    """
+    mean, std = cv2.meanStdDev(gray[::16, ::16])
+    avg_brightness = float(mean[0, 0])
+    std_brightness = float(std[0, 0])
+    if avg_brightness > 120 or (avg_brightness < 30 and std_brightness < 10):
+        return avg_brightness, std_brightness
+    
+    # Mean and standard deviation in a single pass
+    mean, std = cv2.meanStdDev(gray)
+    return float(mean[0, 0]), float(std[0, 0])
+
+
+def read_image(img_path, flags=cv2.IMREAD_COLOR):
+    """
+    Decode an image file with cv2.imdecode from a read-only memory map.
+    
+    The encoded bytes are paged in by the OS instead of being copied into a
+    separate buffer, and the mapping is released as soon as decoding is done,
+    so only the decoded pixels stay resident. Unlike cv2.imread this also
+    handles non-ASCII paths on Windows.
+    
+    Returns:
+        The decoded image, or None if the file is empty or cannot be read/decoded
+    """
+    try:
+        with open(img_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                buf = np.frombuffer(mapped, dtype=np.uint8)
+                try:
+                    img = cv2.imdecode(buf, flags)
+                finally:
+                    # The array must be gone before the mapping can be closed,
+                    # also when decoding fails
+                    buf = None
+    except (OSError, ValueError, cv2.error):
+        return None
+    return img
+
+
+def load_frame_features(img_path, max_width=640, max_height=480):
+    """
+    Decode an image once and compute the features used for filtering.
+    
+    JPEGs are decoded straight to grayscale at 1/2 scale, which libjpeg does
+    in the DCT domain (a 1920x1080 frame decodes to 960x540), so there is no
+    full-size decode or color conversion. 1/4 scale would be faster still but
+    smooths the image enough to shift the contrast used by is_black_frame.
+    
+    Brightness, histogram and hash are measured on the decoded image; the
+    pixel-wise comparison only keeps a small thumbnail, which is plenty for
+    the near-identical MSE/abs-diff checks and keeps per-frame memory tiny.
+    
+    Args:
+        img_path: Path to the image
+        max_width: Maximum width of the grayscale analysis image (default: 640)
+        max_height: Maximum height of the grayscale analysis image (default: 480)
+    
+    Returns:
+        FrameFeatures, or None if the image could not be read or analysed
+    """
+    try:
+        gray = read_image(img_path, cv2.IMREAD_REDUCED_GRAYSCALE_2)
+        if gray is None:
+            return None
+        
+        # Resize for comparison (use smaller size for speed)
+        height, width = gray.shape
+        aspect_ratio = width / height
+        if width > max_width or height > max_height:
+            gray = cv2.resize(gray, (min(width, max_width), min(height, max_height)))
+        
+        thumb = cv2.resize(gray, THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA)
+        avg_brightness, std_brightness = brightness_stats(gray)
+        return FrameFeatures(thumb, avg_brightness, std_brightness, gray_histogram(gray), phash(gray),
+                             aspect_ratio)
+    except Exception as e:
+        # e.g. the reduced decode asserts on images with a 1-pixel dimension;
+        # such images are treated like unreadable ones (filtered as black)
+        return None
+
+
+def load_all_frame_features(image_paths):
+    """
+    Run load_frame_features over all images on a thread pool with one worker
+    per CPU. OpenCV releases the GIL while decoding and resizing, so threads
+    scale with cores without the start-up and pickling cost of processes.
+    Falls back to a plain loop on single-core machines.
+    
+    Returns:
+        List of FrameFeatures (or None for unreadable images) in input order
+    """
+    workers = os.cpu_count() or 1
+    if workers < 2 or len(image_paths) < 2:
+        return [load_frame_features(img_path) for img_path in image_paths]
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(load_frame_features, image_paths))
+
+
+def is_black_frame(avg_brightness, std_brightness):
+    """
+    Check if a frame is too dark/black to be useful.
+    Accepts scalars or NumPy arrays of per-frame brightness statistics.
+    """
+    # Consider dark/black if:
+    # 1. Very dark and low contrast (black screen)
+    # 2. Moderately dark with very low contrast (fade to black)
+    # 3. Very low average brightness (mostly black)
+    is_very_dark = (avg_brightness < 50) & (std_brightness < 20)
+    is_dark_low_contrast = (avg_brightness < 80) & (std_brightness < 25)
+    is_mostly_black = avg_brightness < 60
+    return is_very_dark | is_dark_low_contrast | is_mostly_black
+
+
+def compare_frame_features(features1, features2, similarity_threshold=0.88, mse_threshold=5.0):
+    """
+    Check if two decoded frames are very similar (potential duplicates).
     Also filters out black/dark frames.
     
     Args:
-        img1_path: Path to first image
-        img2_path: Path to second image
+        features1: FrameFeatures of the first image
+        features2: FrameFeatures of the second image
         similarity_threshold: Histogram correlation threshold (default: 0.88)
                             Higher = more strict (fewer duplicates detected)
         mse_threshold: Maximum MSE for considering frames similar (default: 5.0)
@@ -27,27 +201,15 @@ def are_frames_similar(img1_path, img2_path, similarity_threshold=0.88, mse_thre
         True if images are similar or if either is black, False otherwise
     """
     try:
-        img1 = cv2.imread(str(img1_path))
-        img2 = cv2.imread(str(img2_path))
-        
-        if img1 is None or img2 is None:
-            return False
-        
-        # Resize to same size for comparison (use smaller size for speed)
-        height = min(img1.shape[0], img2.shape[0], 480)
-        width = min(img1.shape[1], img2.shape[1], 640)
-        img1_resized = cv2.resize(img1, (width, height))
-        img2_resized = cv2.resize(img2, (width, height))
-        
-        # Convert to grayscale
-        gray1 = cv2.cvtColor(img1_resized, cv2.COLOR_BGR2GRAY)
-        gray2 = cv2.cvtColor(img2_resized, cv2.COLOR_BGR2GRAY)
+        # Thumbnails always have the same size, whatever the source images
+        thumb1 = features1.thumb
+        thumb2 = features2.thumb
         
         # Check if either frame is too dark/black
-        avg_bright1 = np.mean(gray1)
-        avg_bright2 = np.mean(gray2)
-        std_bright1 = np.std(gray1)
-        std_bright2 = np.std(gray2)
+        avg_bright1 = features1.avg_brightness
+        avg_bright2 = features2.avg_brightness
+        std_bright1 = features1.std_brightness
+        std_bright2 = features2.std_brightness
         
         # If either frame is very dark and low contrast, consider it a duplicate to filter out
         is_black1 = avg_bright1 < 50 and std_bright1 < 20
@@ -61,32 +223,136 @@ def are_frames_similar(img1_path, img2_path, similarity_threshold=0.88, mse_thre
         if (is_black1 or is_black2) and (avg_bright1 < 80 or avg_bright2 < 80):
             return True
         
-        # Calculate histogram correlation
-        hist1 = cv2.calcHist([gray1], [0], None, [256], [0, 256])
-        hist2 = cv2.calcHist([gray2], [0], None, [256], [0, 256])
-        hist_corr = cv2.compareHist(hist1, hist2, cv2.HISTCMP_CORREL)
-        
-        # Calculate MSE (mean squared error)
-        mse = np.mean((gray1 - gray2) ** 2)
+        # Frames with different aspect ratios come from different sources and
+        # are never duplicates, whatever their content looks like
+        if abs(features1.aspect_ratio - features2.aspect_ratio) > 0.05 * features1.aspect_ratio:
+            return False
         
-        # Calculate absolute difference
-        abs_diff = np.mean(np.abs(gray1.astype(float) - gray2.astype(float)))
+        # Cheap perceptual hash prefilter: near-identical pairs are decided here.
+        # The low frequencies mostly encode the slide layout, so different
+        # slides built on the same template can be only a few bits apart;
+        # only (almost) exact hash matches are accepted. There is no early
+        # reject, since frames with a large hash distance can still be
+        # duplicates by the histogram rules below.
+        if hamming_distance(features1.phash, features2.phash) <= 2:
+            return True
         
         # Consider frames similar if:
-        # 1. High histogram correlation AND low MSE (similar color distribution and pixel values)
-        # 2. Low absolute difference (very similar pixel-wise) - made more aggressive
-        # 3. Very high histogram correlation (almost identical images)
-        is_similar_hist_mse = hist_corr > similarity_threshold and mse < mse_threshold
-        is_similar_abs_diff = abs_diff < 2.0  # Very low absolute difference - made more aggressive
-        is_very_similar_hist = hist_corr > 0.95  # Almost identical histogram - made more aggressive
+        # 1. Very high histogram correlation (almost identical images)
+        # 2. High histogram correlation AND low MSE (similar color distribution and pixel values)
+        # 3. Low absolute difference (very similar pixel-wise) - made more aggressive
+        # The rules are evaluated cheapest first, so the pixel-wise norms only
+        # run when the histogram alone cannot decide.
         
-        return is_similar_hist_mse or is_similar_abs_diff or is_very_similar_hist
+        # Calculate histogram correlation
+        hist_corr = float(np.dot(features1.hist, features2.hist))
+        if hist_corr > 0.95:  # Almost identical histogram - made more aggressive
+            return True
+        
+        # Calculate MSE (mean squared error) and mean absolute difference with
+        # OpenCV's two-input norms; no difference image is allocated and there
+        # is no uint8 wrap-around
+        if hist_corr > similarity_threshold:
+            mse = cv2.norm(thumb1, thumb2, cv2.NORM_L2SQR) / thumb1.size
+            if mse < mse_threshold:
+                return True
+        
+        abs_diff = cv2.norm(thumb1, thumb2, cv2.NORM_L1) / thumb1.size
+        return abs_diff < 2.0  # Very low absolute difference - made more aggressive
     except Exception as e:
         # If comparison fails, assume not similar
         return False
 
 
-def generate_reveal_markdown(frames_dir, output_file, title="Presentation", theme="white"):
+def are_frames_similar(img1_path, img2_path, similarity_threshold=0.88, mse_threshold=5.0):
+    """
+    Check if two images are very similar (potential duplicates).
+    Also filters out black/dark frames.
+    
+    Args:
+        img1_path: Path to first image
+        img2_path: Path to second image
+        similarity_threshold: Histogram correlation threshold (default: 0.88)
+                            Higher = more strict (fewer duplicates detected)
+        mse_threshold: Maximum MSE for considering frames similar (default: 5.0)
+    
+    Returns:
+        True if images are similar or if either is black, False otherwise
+    """
+    features1 = load_frame_features(img1_path)
+    features2 = load_frame_features(img2_path)
+    if features1 is None or features2 is None:
+        return False
+    return compare_frame_features(features1, features2, similarity_threshold, mse_threshold)
+
+
+def list_images(directory):
+    """
+    List the image files in a directory, sorted by name (case-insensitive).
+    Uses a single os.scandir pass instead of one glob per extension.
+    """
+    # Sort (lower-cased name, path) pairs straight from the directory entries;
+    # the path breaks ties between names differing only in case, and Path
+    # objects are only built for the final, sorted list
+    with os.scandir(directory) as it:
+        keyed = [(e.name.lower(), e.path) for e in it
+                 if os.path.splitext(e.name)[1].lower() in IMAGE_EXTENSIONS and e.is_file()]
+    keyed.sort()
+    return [Path(path) for _, path in keyed]
+
+
+def filter_frames(all_images, similarity_threshold=0.88, mse_threshold=5.0):
+    """
+    Drop black/dark frames and consecutive duplicates from a list of images.
+    
+    Args:
+        all_images: Image paths in presentation order
+        similarity_threshold: Histogram correlation threshold passed to compare_frame_features
+        mse_threshold: MSE threshold passed to compare_frame_features
+    
+    Returns:
+        (filtered_images, black_frame_count, duplicate_count)
+    """
+    # Decode every image once, then filter on the cached features
+    all_features = load_all_frame_features(all_images)
+    
+    # Black/dark frames are detected for all images at once from the
+    # brightness statistics; unreadable images are dropped as well
+    readable = np.array([f is not None for f in all_features], dtype=bool)
+    avg_brightness = np.array([f.avg_brightness if f is not None else 0.0 for f in all_features])
+    std_brightness = np.array([f.std_brightness if f is not None else 0.0 for f in all_features])
+    black_mask = ~readable | is_black_frame(avg_brightness, std_brightness)
+    black_frame_count = int(np.count_nonzero(black_mask))
+    
+    # Filter out consecutive duplicates against the last kept frame
+    filtered_images = []
+    previous_features = None
+    duplicate_count = 0
+    
+    for index in np.flatnonzero(~black_mask):
+        img_path = all_images[index]
+        features = all_features[index]
+        
+        if previous_features is None:
+            # First image - include it (already checked it's not black)
+            filtered_images.append(img_path)
+            previous_features = features
+        else:
+            # Check if this image is similar to the previous one
+            if compare_frame_features(previous_features, features, similarity_threshold, mse_threshold):
+                duplicate_count += 1
+                # Skip this duplicate
+                continue
+            else:
+                # Not a duplicate - include it
+                filtered_images.append(img_path)
+                previous_features = features
+    
+    return filtered_images, black_frame_count, duplicate_count
+
+
+def generate_reveal_markdown(frames_dir, output_file, title="Presentation", theme="white",
+                             dedup=True, similarity_threshold=0.88, mse_threshold=5.0):
     """
     Generate a reveal.js markdown file from extracted frames.
     
@@ -95,6 +361,11 @@ def generate_reveal_markdown(frames_dir, output_file, title="Presentation", them
         output_file: Output markdown file path
         title: Presentation title
         theme: Reveal.js theme (default, black, white, league, beige, sky, night, serif, simple, solarized)
+        dedup: Filter out black/dark and duplicate frames (default: True)
+               Disable when the frames are already de-duplicated (e.g. extracted with -d)
+               to skip decoding every image
+        similarity_threshold: Histogram correlation threshold for duplicates (default: 0.88)
+        mse_threshold: Maximum MSE for considering frames duplicates (default: 5.0)
     """
     frames_dir = Path(frames_dir)
     output_file = Path(output_file)
@@ -104,27 +375,24 @@ def generate_reveal_markdown(frames_dir, output_file, title="Presentation", them
         return
     
     # Find all image files
-    image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
     image_files = []
     
-    # Group by video directory if frames are organized by video
-    video_dirs = [d for d in frames_dir.iterdir() if d.is_dir()]
+    # Group by video directory if frames are organized by video; os.scandir
+    # reports entry types from the directory listing, without a stat per entry
+    with os.scandir(frames_dir) as it:
+        keyed = [(e.name.lower(), e.path) for e in it if e.is_dir()]
+    keyed.sort()
+    video_dirs = [Path(path) for _, path in keyed]
     
     if video_dirs:
         # Frames organized by video - sort alphabetically by video name
-        for video_dir in sorted(video_dirs, key=lambda x: x.name.lower()):
-            video_images = []
-            for ext in image_extensions:
-                video_images.extend(sorted(video_dir.glob(f"*{ext}")))
-                video_images.extend(sorted(video_dir.glob(f"*{ext.upper()}")))
+        for video_dir in video_dirs:
+            video_images = list_images(video_dir)
             if video_images:
                 image_files.append((video_dir.name, video_images))
     else:
         # All frames in the root directory
-        all_images = []
-        for ext in image_extensions:
-            all_images.extend(sorted(frames_dir.glob(f"*{ext}")))
-            all_images.extend(sorted(frames_dir.glob(f"*{ext.upper()}")))
+        all_images = list_images(frames_dir)
         if all_images:
             image_files.append(("All Videos", all_images))
     
@@ -132,60 +400,18 @@ def generate_reveal_markdown(frames_dir, output_file, title="Presentation", them
         print(f"Error: No image files found in: {frames_dir}")
         return
     
-    # Generate markdown content - start directly with frame slides, no intro/exit slides
-    markdown_lines = []
-    
     # Collect all images in order, filtering out duplicates
     all_images = []
     for video_name, images in image_files:
         all_images.extend(images)
     
-    # Filter out consecutive duplicates and black/dark frames
-    filtered_images = []
-    previous_image = None
-    duplicate_count = 0
-    black_frame_count = 0
-    
-    def is_black_frame(img_path):
-        """Check if a frame is too dark/black to be useful."""
-        try:
-            img = cv2.imread(str(img_path))
-            if img is None:
-                return True
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-            avg_brightness = np.mean(gray)
-            std_brightness = np.std(gray)
-            # Consider dark/black if:
-            # 1. Very dark and low contrast (black screen)
-            # 2. Moderately dark with very low contrast (fade to black)
-            # 3. Very low average brightness (mostly black)
-            is_very_dark = avg_brightness < 50 and std_brightness < 20
-            is_dark_low_contrast = avg_brightness < 80 and std_brightness < 25
-            is_mostly_black = avg_brightness < 60
-            return is_very_dark or is_dark_low_contrast or is_mostly_black
-        except:
-            return False
-    
-    for img_path in all_images:
-        # First, check if this frame is too dark/black
-        if is_black_frame(img_path):
-            black_frame_count += 1
-            continue
-        
-        if previous_image is None:
-            # First image - include it (already checked it's not black)
-            filtered_images.append(img_path)
-            previous_image = img_path
-        else:
-            # Check if this image is similar to the previous one
-            if are_frames_similar(previous_image, img_path):
-                duplicate_count += 1
-                # Skip this duplicate
-                continue
-            else:
-                # Not a duplicate - include it
-                filtered_images.append(img_path)
-                previous_image = img_path
+    if dedup:
+        filtered_images, black_frame_count, duplicate_count = filter_frames(
+            all_images, similarity_threshold, mse_threshold)
+    else:
+        # Trust the extractor's output as is: no image is decoded at all
+        filtered_images = all_images
+        black_frame_count = duplicate_count = 0
     
     if duplicate_count > 0 or black_frame_count > 0:
         msg_parts = []
@@ -195,41 +421,37 @@ def generate_reveal_markdown(frames_dir, output_file, title="Presentation", them
             msg_parts.append(f"{duplicate_count} duplicate frames")
         print(f"  Filtered out: {', '.join(msg_parts)}")
     
-    # Generate slides from filtered images
-    first_slide = True
-    for img_path in filtered_images:
-        # Use relative path from output file to image
-        # If output_file is in a subdirectory, paths should be relative to that directory
-        relative_path = os.path.relpath(img_path, output_file.parent)
-        # Replace backslashes with forward slashes for cross-platform compatibility
-        relative_path = relative_path.replace('\\', '/')
-        # Ensure path uses forward slashes for web compatibility
-        if not relative_path.startswith('./') and not relative_path.startswith('../'):
-            # If path doesn't start with ./ or ../, it might need adjustment
-            pass
-        
-        # Don't add separator before first slide
-        if not first_slide:
-            markdown_lines.append("---\n")
-            markdown_lines.append("\n")
-        else:
-            first_slide = False
-        
-        markdown_lines.append(f'<!-- .slide: data-background="{relative_path}" data-background-size="contain" data-background-color="black" -->\n')
-        markdown_lines.append("\n")
-        markdown_lines.append("<!-- Add your slide content here -->\n")
-        markdown_lines.append("\n")
-    
-    # Write markdown file
+    # Generate markdown content - start directly with frame slides, no intro/exit slides.
+    # Slides are streamed to the file one at a time instead of being joined in memory.
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(''.join(markdown_lines))
     
-    total_original = sum(len(images) for _, images in image_files)
-    total_filtered = len(filtered_images)
+    # Use relative path from output file to image
+    # If output_file is in a subdirectory, paths should be relative to that directory.
+    # All images live under frames_dir, so the relative path to frames_dir is
+    # computed once and each image only appends its path inside frames_dir.
+    # Replace backslashes with forward slashes for cross-platform compatibility
+    frames_prefix = os.path.relpath(frames_dir, output_file.parent).replace('\\', '/')
+    frames_prefix = '' if frames_prefix == '.' else frames_prefix + '/'
+    
+    # Images are listed from inside frames_dir, so their paths relative to it
+    # are plain string suffixes; no Path objects are built per slide
+    frames_base = str(frames_dir) + os.sep
+    base_len = len(frames_base)
+    
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        for i, img_path in enumerate(filtered_images):
+            img_str = str(img_path)
+            if img_str.startswith(frames_base):
+                relative_path = img_str[base_len:]
+            else:
+                relative_path = os.path.relpath(img_str, frames_dir)
+            relative_path = frames_prefix + relative_path.replace(os.sep, '/')
+            # Don't add separator before first slide
+            separator = SLIDE_SEPARATOR if i > 0 else ""
+            f.write(separator + SLIDE_TEMPLATE.format(path=relative_path))
     
     print(f"Generated reveal.js markdown: {output_file}")
-    print(f"Total slides: {total_filtered} (from {total_original} frames)")
+    print(f"Total slides: {len(filtered_images)} (from {len(all_images)} frames)")
 
 
 def main():
@@ -238,10 +460,16 @@ def main():
     parser.add_argument("-o", "--output", default="slides.md", help="Output markdown file (default: slides.md)")
     parser.add_argument("-t", "--title", default="Presentation", help="Presentation title (default: Presentation)")
     parser.add_argument("--theme", default="white", help="Reveal.js theme (default: white)")
+    parser.add_argument("--no-dedup", action="store_true", help="Skip black/duplicate frame filtering (faster, keeps every frame)")
+    parser.add_argument("--similarity-threshold", type=float, default=0.88, help="Histogram correlation threshold for duplicates (default: 0.88, higher = fewer duplicates)")
+    parser.add_argument("--mse-threshold", type=float, default=5.0, help="Maximum MSE for considering frames duplicates (default: 5.0, lower = fewer duplicates)")
     
     args = parser.parse_args()
     
-    generate_reveal_markdown(args.frames_dir, args.output, args.title, args.theme)
+    generate_reveal_markdown(args.frames_dir, args.output, args.title, args.theme,
+                             dedup=not args.no_dedup,
+                             similarity_threshold=args.similarity_threshold,
+                             mse_threshold=args.mse_threshold)
 
 
 if __name__ == "__main__":